@@ -0,0 +1,22 @@
+"""Gunicorn configuration for the AI model service.
+
+preload_app imports app.py once in the master process - loading the
+cached model and warming any compiled kernels - so forked workers share
+those pages copy-on-write instead of each paying the startup cost.
+
+Run with: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import multiprocessing
+import os
+
+# One BLAS/OpenMP thread per worker: parallelism comes from worker
+# processes, and letting every worker spawn nCPU math threads
+# oversubscribes the box
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
+bind = os.getenv("BIND", "0.0.0.0:5001")
+workers = int(os.getenv("WEB_CONCURRENCY", str(min(4, multiprocessing.cpu_count()))))
+worker_class = "gevent"
+preload_app = True
+timeout = 60
@@ -147,7 +147,7 @@ class HealthRiskAssessment:
             return risk_score, risk_level, risk_breakdown
             
         except Exception as e:
-            logger.error(f"Error calculating risk score: {e}")
+            logger.error("Error calculating risk score: %s", e)
             return 0.5, "Medium", {}
     
     def assess_disease_specific_risks(self, user_data: Dict, symptoms: List[str]) -> Dict:
@@ -310,7 +310,7 @@ class HealthRiskAssessment:
             return insights
             
         except Exception as e:
-            logger.error(f"Error generating health insights: {e}")
+            logger.error("Error generating health insights: %s", e)
             return self._get_default_insights()
     
     def _identify_priority_areas(self, risk_breakdown: Dict, disease_risks: Dict) -> List[str]:
@@ -55,7 +55,7 @@ class DrugInteraction:
     mechanism: str
     recommendation: str
 
-@dataclass
+@dataclass(slots=True)
 class MedicationReminder:
     medication_id: str
     medication_name: str
@@ -66,6 +66,20 @@ class MedicationReminder:
     missed: bool
     notes: str
 
+    def as_payload(self) -> Dict:
+        """Serialization-ready dict; datetimes stay native so a C JSON
+        encoder (orjson) can emit them without per-field isoformat calls."""
+        return {
+            'medication_id': self.medication_id,
+            'medication_name': self.medication_name,
+            'dosage': self.dosage,
+            'scheduled_time': self.scheduled_time,
+            'taken': self.taken,
+            'taken_time': self.taken_time,
+            'missed': self.missed,
+            'notes': self.notes
+        }
+
 @dataclass
 class AdherenceReport:
     medication_id: str
@@ -83,6 +97,12 @@ class SmartMedicationManager:
     def __init__(self):
         # Load comprehensive drug interaction database
         self.drug_interactions = self._load_drug_interactions_db()
+        # Index interactions by unordered drug-name pair so lookups are O(1)
+        # instead of scanning the whole list for every medication pair
+        self._interaction_index = {
+            frozenset((interaction.drug1.lower(), interaction.drug2.lower())): interaction
+            for interaction in self.drug_interactions
+        }
         self.medication_database = self._load_medication_database()
         self.side_effects_db = self._load_side_effects_database()
         
@@ -326,7 +346,7 @@ class SmartMedicationManager:
             }
             
         except Exception as e:
-            logger.error(f"Error adding medication: {e}")
+            logger.error("Error adding medication: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -434,7 +454,7 @@ class SmartMedicationManager:
             }
             
         except Exception as e:
-            logger.error(f"Error checking drug interactions: {e}")
+            logger.error("Error checking drug interactions: %s", e)
             return {
                 'error': str(e),
                 'total_interactions': 0,
@@ -446,11 +466,7 @@ class SmartMedicationManager:
     
     def _find_interaction(self, drug1: str, drug2: str) -> Optional[DrugInteraction]:
         """Find interaction between two drugs"""
-        for interaction in self.drug_interactions:
-            if ((interaction.drug1.lower() == drug1 and interaction.drug2.lower() == drug2) or
-                (interaction.drug1.lower() == drug2 and interaction.drug2.lower() == drug1)):
-                return interaction
-        return None
+        return self._interaction_index.get(frozenset((drug1, drug2)))
     
     def _assess_overall_risk(self, interactions: List[Dict]) -> str:
         """Assess overall interaction risk level"""
@@ -525,7 +541,7 @@ class SmartMedicationManager:
             return reminders
             
         except Exception as e:
-            logger.error(f"Error generating reminders: {e}")
+            logger.error("Error generating reminders: %s", e)
             return []
     
     def _get_next_doses(self, medication: Medication, days: int = 7) -> List[Dict]:
@@ -541,10 +557,12 @@ class SmartMedicationManager:
                 dose_time = dose_date.replace(hour=hour, minute=minute)
                 
                 if dose_time > datetime.now():
+                    # Native date/datetime objects; orjson encodes them in C,
+                    # skipping the per-dose isoformat calls
                     next_doses.append({
-                        'date': dose_time.date().isoformat(),
+                        'date': dose_time.date(),
                         'time': time_str,
-                        'datetime': dose_time.isoformat(),
+                        'datetime': dose_time,
                         'dosage': medication.dosage
                     })
         
@@ -601,7 +619,7 @@ class SmartMedicationManager:
             )
             
         except Exception as e:
-            logger.error(f"Error calculating adherence: {e}")
+            logger.error("Error calculating adherence: %s", e)
             return AdherenceReport(
                 medication_id=medication_id,
                 medication_name='Error',
@@ -701,7 +719,7 @@ class SmartMedicationManager:
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing side effects: {e}")
+            logger.error("Error analyzing side effects: %s", e)
             return {
                 'error': str(e),
                 'potential_medication_causes': [],
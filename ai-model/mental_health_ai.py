@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import functools
 import json
 import random
 from typing import Dict, List, Any, Optional
@@ -832,6 +833,9 @@ def get_mental_health_summary(user_id, days=30):
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+# The resource getters are parameter-free and back onto static data, so
+# cache the built payloads once per process
+@functools.lru_cache(maxsize=1)
 def get_crisis_resources():
     """Get crisis intervention resources"""
     try:
@@ -839,6 +843,7 @@ def get_crisis_resources():
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+@functools.lru_cache(maxsize=1)
 def get_professional_help_resources():
     """Get professional mental health resources"""
     try:
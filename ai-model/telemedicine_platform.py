@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import json
 import random
 from typing import Dict, List, Any, Optional
+from cachetools import TTLCache
 import uuid
 
 class TelemedicinePlatform:
@@ -18,6 +19,9 @@ class TelemedicinePlatform:
             'Pediatrics', 'Gynecology', 'Orthopedics', 'Neurology',
             'Endocrinology', 'Gastroenterology', 'Pulmonology', 'Oncology'
         ]
+        # Doctor listings only change when slots are booked or released;
+        # cache them per (specialty, consultation_type) for 10 minutes
+        self._doctors_cache = TTLCache(maxsize=256, ttl=600)
         self.initialize_mock_doctors()
 
     def initialize_mock_doctors(self):
@@ -75,6 +79,11 @@ class TelemedicinePlatform:
 
     def get_available_doctors(self, specialty: str = None, consultation_type: str = 'video') -> List[Dict]:
         """Get list of available doctors based on specialty and consultation type"""
+        cache_key = (specialty, consultation_type)
+        cached = self._doctors_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         available_doctors = []
         
         for doctor_id, doctor_data in self.doctors_availability.items():
@@ -103,6 +112,7 @@ class TelemedicinePlatform:
         
         # Sort by rating and next available time
         available_doctors.sort(key=lambda x: (-x['rating'], x['next_available']))
+        self._doctors_cache[cache_key] = available_doctors
         return available_doctors
 
     def get_next_available_slot(self, doctor_id: str) -> Optional[str]:
@@ -138,6 +148,9 @@ class TelemedicinePlatform:
             
             if not slot_found:
                 return {'success': False, 'error': 'Time slot not available'}
+
+            # Slot availability changed; drop cached doctor listings
+            self._doctors_cache.clear()
             
             # Create appointment
             appointment = {
@@ -391,7 +404,10 @@ class TelemedicinePlatform:
         
         if not slot_found:
             return {'success': False, 'error': 'New time slot not available'}
-        
+
+        # Slot availability changed; drop cached doctor listings
+        self._doctors_cache.clear()
+
         # Update appointment
         appointment['scheduled_time'] = new_slot_datetime
         appointment['rescheduled_at'] = datetime.now().isoformat()
@@ -425,7 +441,10 @@ class TelemedicinePlatform:
             if slot['datetime'] == slot_datetime:
                 slot['available'] = True
                 break
-        
+
+        # Slot availability changed; drop cached doctor listings
+        self._doctors_cache.clear()
+
         # Update appointment
         appointment['status'] = 'cancelled'
         appointment['cancelled_at'] = datetime.now().isoformat()
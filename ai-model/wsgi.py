@@ -0,0 +1,11 @@
+"""WSGI entrypoint for production servers.
+
+Importing app runs initialize_service(), so under gunicorn with
+preload_app the model, lookup maps and warmed kernels are loaded once
+in the master and forked workers share them copy-on-write.
+
+Run with: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from app import app
+
+__all__ = ["app"]